@@ -0,0 +1,68 @@
+"""Ahead-of-time build of the compliance validation kernel.
+
+Running ``python -m subsync._valid_aot`` compiles ``validate_timings`` into
+the ``subsync.subsync_valid`` extension module next to this file, so the CLI
+pays no JIT cost at runtime. When the extension is missing,
+``subsync.compliance`` JIT-compiles the same function instead.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+
+MODULE_NAME = "subsync_valid"
+SIGNATURE = "UniTuple(i8, 2)(i8[::1], i8[::1], i4[::1], i4, i4, i4, f8)"
+
+
+def validate_timings(
+    starts: npt.NDArray[np.int64],
+    ends: npt.NDArray[np.int64],
+    char_counts: npt.NDArray[np.int32],
+    min_dur: int,
+    max_dur: int,
+    min_gap: int,
+    max_cps: float,
+) -> tuple[int, int]:
+    """Count timing and CPS violations over aligned subtitle arrays.
+
+    Args:
+        starts: Start times in integer milliseconds (int64, exact for any length).
+        ends: End times in integer milliseconds (int64, exact for any length).
+        char_counts: Character count of each subtitle.
+        min_dur: Minimum duration in milliseconds.
+        max_dur: Maximum duration in milliseconds.
+        min_gap: Minimum gap from the previous subtitle in milliseconds.
+        max_cps: Maximum characters per second.
+
+    Returns:
+        Tuple of (subtitles with timing issues, subtitles exceeding CPS).
+    """
+    timing_issues = 0
+    cps_warnings = 0
+    for i in range(starts.shape[0]):
+        duration = ends[i] - starts[i]
+        bad_timing = duration < min_dur or duration > max_dur
+        if i > 0 and starts[i] - ends[i - 1] < min_gap:
+            bad_timing = True
+        if bad_timing:
+            timing_issues += 1
+        # Same expression as Subtitle.cps so both agree at the limit
+        if char_counts[i] * 1000 / max(duration, 1) > max_cps:
+            cps_warnings += 1
+    return timing_issues, cps_warnings
+
+
+def build() -> None:
+    """Compile the kernel into an extension module inside the package."""
+    # Imported lazily: pycc needs setuptools, which is only a build-time tool.
+    from numba.pycc import CC
+
+    cc = CC(MODULE_NAME)
+    cc.output_dir = str(Path(__file__).parent)
+    cc.export("validate_timings", SIGNATURE)(validate_timings)
+    cc.compile()
+
+
+if __name__ == "__main__":
+    build()
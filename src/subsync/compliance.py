@@ -0,0 +1,77 @@
+"""Netflix compliance validation for subtitle timing and reading speed."""
+
+from collections.abc import Sequence
+
+import numpy as np
+
+from subsync._valid_aot import SIGNATURE, validate_timings
+from subsync.models import ComplianceReport, ProcessingConfig, Subtitle
+
+
+try:
+    from subsync.subsync_valid import validate_timings as _validate_timings
+except ImportError:
+    # No AOT build available (e.g. running from a source checkout): JIT the
+    # same kernel. The explicit signature compiles it eagerly at import.
+    # numba is imported only here so the AOT path never pays for it.
+    import numba as nb
+
+    _validate_timings = nb.njit(SIGNATURE, cache=True)(validate_timings)
+
+
+def build_compliance_report(
+    subtitles: Sequence[Subtitle], config: ProcessingConfig
+) -> ComplianceReport:
+    """Validate subtitles against Netflix timing, CPS and line length rules.
+
+    Timing and line length violations are blocking; CPS violations are
+    reported as warnings only.
+
+    Args:
+        subtitles: Ordered subtitle events.
+        config: Processing limits to validate against.
+
+    Returns:
+        Aggregate compliance report for the subtitles.
+    """
+    count = len(subtitles)
+    starts = np.fromiter((s.start_time for s in subtitles), np.int64, count)
+    ends = np.fromiter((s.end_time for s in subtitles), np.int64, count)
+    char_counts = np.fromiter((s.char_count for s in subtitles), np.int32, count)
+
+    max_cps = config.max_cps_children if config.is_children_content else config.max_cps_adult
+    timing_issues, cps_warnings = _validate_timings(
+        starts,
+        ends,
+        char_counts,
+        np.int32(config.min_duration_ms),
+        np.int32(config.max_duration_ms),
+        np.int32(config.min_gap_ms),
+        max_cps,
+    )
+    line_length_issues = sum(
+        len(line) > config.max_chars_per_line
+        for subtitle in subtitles
+        for line in subtitle.lines
+    )
+
+    warnings: list[str] = []
+    errors: list[str] = []
+    if cps_warnings:
+        warnings.append(f"{cps_warnings} subtitle(s) exceed {max_cps:g} CPS")
+    if timing_issues:
+        errors.append(f"{timing_issues} subtitle(s) have timing issues")
+    if line_length_issues:
+        errors.append(
+            f"{line_length_issues} line(s) exceed {config.max_chars_per_line} characters"
+        )
+
+    return ComplianceReport(
+        total_subtitles=count,
+        timing_issues=timing_issues,
+        cps_warnings=cps_warnings,
+        line_length_issues=line_length_issues,
+        is_compliant=not errors,
+        warnings=tuple(warnings),
+        errors=tuple(errors),
+    )
@@ -8,7 +8,7 @@ class SubSyncError(Exception):
     enabling catch-all handling when needed.
     """
 
-    pass
+    __slots__ = ()
 
 
 class URLParseError(SubSyncError):
@@ -20,7 +20,7 @@ class URLParseError(SubSyncError):
     - Video ID format is invalid (not 11 characters, invalid chars)
     """
 
-    pass
+    __slots__ = ()
 
 
 class VideoUnavailableError(SubSyncError):
@@ -33,7 +33,7 @@ class VideoUnavailableError(SubSyncError):
     - Video requires purchase
     """
 
-    pass
+    __slots__ = ()
 
 
 class AgeRestrictedError(SubSyncError):
@@ -43,7 +43,7 @@ class AgeRestrictedError(SubSyncError):
     for authentication.
     """
 
-    pass
+    __slots__ = ()
 
 
 class LiveStreamError(SubSyncError):
@@ -53,7 +53,7 @@ class LiveStreamError(SubSyncError):
     a completed video.
     """
 
-    pass
+    __slots__ = ()
 
 
 class TranscriptionError(SubSyncError):
@@ -65,4 +65,4 @@ class TranscriptionError(SubSyncError):
     - Transcription process fails
     """
 
-    pass
+    __slots__ = ()
@@ -4,17 +4,22 @@ This module defines the core data structures used throughout the SubSync applica
 ensuring consistent data flow between modules.
 """
 
+import sys
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import timedelta
 from pathlib import Path
 
+import numpy as np
+import numpy.typing as npt
+
 
 # =============================================================================
 # Core Models
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VideoMetadata:
     """Extracted information about a YouTube video.
 
@@ -32,8 +37,13 @@ class VideoMetadata:
     uploader: str
     upload_date: str
 
+    def __post_init__(self) -> None:
+        """Intern low-cardinality fields so repeated values share one object."""
+        object.__setattr__(self, "uploader", sys.intern(self.uploader))
+        object.__setattr__(self, "upload_date", sys.intern(self.upload_date))
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class Word:
     """Individual word with precise timing from Whisper.
 
@@ -48,7 +58,7 @@ class Word:
     end: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TranscriptionSegment:
     """A segment of transcribed speech.
 
@@ -67,6 +77,53 @@ class TranscriptionSegment:
     words: list[Word] = field(default_factory=lambda: [])
 
 
+@dataclass(slots=True, frozen=True, eq=False)
+class WordArray:
+    """Word-level timings stored as parallel arrays (structure-of-arrays).
+
+    Used by timing passes that sweep every word, so duration and gap checks
+    run as vectorized NumPy operations instead of per-object Python loops.
+
+    Attributes:
+        words: Word texts, aligned index-wise with starts and ends.
+        starts: Start times in seconds (float32).
+        ends: End times in seconds (float32).
+    """
+
+    words: list[str]
+    starts: npt.NDArray[np.float32]
+    ends: npt.NDArray[np.float32]
+
+    @classmethod
+    def from_segments(cls, segments: Iterable[TranscriptionSegment]) -> "WordArray":
+        """Build a WordArray from the word timestamps of transcription segments.
+
+        Args:
+            segments: Segments in playback order.
+
+        Returns:
+            A WordArray with one entry per word across all segments.
+        """
+        words = [word for segment in segments for word in segment.words]
+        return cls(
+            words=[word.word for word in words],
+            starts=np.fromiter((word.start for word in words), np.float32, len(words)),
+            ends=np.fromiter((word.end for word in words), np.float32, len(words)),
+        )
+
+    def __len__(self) -> int:
+        """Number of words."""
+        return len(self.words)
+
+    def durations(self) -> npt.NDArray[np.float32]:
+        """Duration of each word in seconds."""
+        return self.ends - self.starts
+
+    def gaps(self) -> npt.NDArray[np.float32]:
+        """Gap in seconds between each word and the next (length n - 1)."""
+        return self.starts[1:] - self.ends[:-1]
+
+
 @dataclass
 class TranscriptionResult:
     """Complete output from the transcription process.
@@ -81,44 +138,54 @@ class TranscriptionResult:
     duration: float
     segments: list[TranscriptionSegment]
 
+    def __post_init__(self) -> None:
+        """Intern the language code so comparisons and dict lookups are cheap."""
+        self.language = sys.intern(self.language)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class Subtitle:
     """A single subtitle event ready for output.
 
     Attributes:
         index: Sequential number (1-based for SRT).
-        start_time: Start timestamp.
-        end_time: End timestamp.
+        start_time: Start timestamp in milliseconds.
+        end_time: End timestamp in milliseconds.
         text: Original text (pre-formatting).
         lines: Formatted lines (1-2 max).
+        char_count: Total characters across all lines (computed).
+        duration_ms: Duration in milliseconds (computed).
+        cps: Characters per second, with duration clamped to >= 1ms (computed).
     """
 
     index: int
-    start_time: timedelta
-    end_time: timedelta
+    start_time: int
+    end_time: int
     text: str
     lines: list[str]
+    char_count: int = field(init=False, compare=False)
+    duration_ms: int = field(init=False, compare=False)
+    cps: float = field(init=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Compute derived metrics once so validators can read them in O(1)."""
+        char_count = sum(map(len, self.lines))
+        duration_ms = self.end_time - self.start_time
+        # Clamp the denominator instead of branching; empty text still yields 0
+        cps = char_count * 1000 / max(duration_ms, 1)
+        object.__setattr__(self, "char_count", char_count)
+        object.__setattr__(self, "duration_ms", duration_ms)
+        object.__setattr__(self, "cps", cps)
 
     @property
-    def char_count(self) -> int:
-        """Total characters across all lines."""
-        return sum(len(line) for line in self.lines)
+    def start_timedelta(self) -> timedelta:
+        """Start timestamp as a timedelta, for SRT/VTT time formatting."""
+        return timedelta(milliseconds=self.start_time)
 
     @property
-    def duration_ms(self) -> int:
-        """Duration in milliseconds."""
-        return int((self.end_time - self.start_time).total_seconds() * 1000)
-
-    @property
-    def cps(self) -> float:
-        """Characters per second.
-
-        Returns:
-            Characters per second, or 0 if duration is zero.
-        """
-        duration_secs = self.duration_ms / 1000
-        return self.char_count / duration_secs if duration_secs > 0 else 0
+    def end_timedelta(self) -> timedelta:
+        """End timestamp as a timedelta, for SRT/VTT time formatting."""
+        return timedelta(milliseconds=self.end_time)
 
 
 @dataclass
@@ -143,7 +210,7 @@ class SubtitleFile:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TimingValidation:
     """Result of timing validation for a subtitle.
 
@@ -157,7 +224,7 @@ class TimingValidation:
     is_valid: bool
     duration_ok: bool
     gap_ok: bool
-    issues: list[str] = field(default_factory=lambda: [])
+    issues: tuple[str, ...] = ()
 
 
 @dataclass
@@ -179,8 +246,8 @@ class ComplianceReport:
     cps_warnings: int
     line_length_issues: int
     is_compliant: bool
-    warnings: list[str] = field(default_factory=lambda: [])
-    errors: list[str] = field(default_factory=lambda: [])
+    warnings: tuple[str, ...] = ()
+    errors: tuple[str, ...] = ()
 
 
 # =============================================================================
@@ -1,14 +1,124 @@
 """YouTube URL parsing utilities."""
 
-import re
-from urllib.parse import urlparse, parse_qs
+import functools
+import string
+from collections.abc import Callable
+from urllib.parse import unquote_plus, urlparse
 
 from subsync.errors import URLParseError
 
+_VIDEO_ID_LENGTH = 11
+_VIDEO_ID_ALPHABET = frozenset(string.ascii_letters + string.digits + '_-')
 
+# Longest supported prefix is "https://www.youtube.com", so any YouTube host
+# must appear within this many leading characters.
+_HOST_PROBE_LENGTH = 32
+_HOST_MARKERS = ('youtube.com', 'youtu.be')
+_SCAN_SCHEMES = frozenset({'http', 'https', 'HTTP', 'HTTPS'})
+
+
+def _query_param(query: str, key: str) -> str | None:
+    """Return the first non-blank value for ``key`` in a query string.
+
+    Scans the query once and decodes only the matching value, instead of
+    building the full mapping that ``parse_qs`` would. Keys are compared
+    after decoding, as ``parse_qs`` does.
+
+    Args:
+        query: Raw URL query string (without the leading ``?``).
+        key: Parameter name to look up.
+
+    Returns:
+        The decoded value, or None if the parameter is absent or blank.
+    """
+    for pair in query.split('&'):
+        name, _, value = pair.partition('=')
+        if value and (name == key or unquote_plus(name) == key):
+            return unquote_plus(value)
+    return None
+
+
+def _scan_youtube(url: str) -> tuple[str, str, str] | None:
+    """Split a plain http(s) URL into host, path and query.
+
+    A specialized replacement for ``urlparse`` covering the URL shapes
+    YouTube links actually use. Anything outside that grammar is left to
+    ``urlparse``.
+
+    Args:
+        url: URL to split.
+
+    Returns:
+        Tuple of (host, path, query), or None if the URL has a different
+        scheme, credentials, a port, an IPv6 host, ;params in the path, or
+        unprintable characters.
+    """
+    scheme_end = url.find('://')
+    if scheme_end == -1 or url[:scheme_end] not in _SCAN_SCHEMES:
+        return None
+    if not url.isprintable():
+        return None
+
+    start = scheme_end + 3
+    end = url.find('#', start)
+    if end == -1:
+        end = len(url)
+    query_start = url.find('?', start, end)
+    path_end = query_start if query_start != -1 else end
+    host_end = url.find('/', start, path_end)
+    if host_end == -1:
+        host_end = path_end
+
+    host = url[start:host_end]
+    if '@' in host or ':' in host or '[' in host:
+        return None
+    path = url[host_end:path_end]
+    if ';' in path:
+        # urlparse splits ;params off the path; leave that to it
+        return None
+    query = url[query_start + 1:end] if query_start != -1 else ''
+    return host, path, query
+
+
+def _from_short(segments: list[str], query: str) -> str | None:
+    """youtu.be/VIDEO_ID"""
+    return segments[1] if len(segments) >= 2 else None
+
+
+def _from_watch(segments: list[str], query: str) -> str | None:
+    """youtube.com/watch?v=VIDEO_ID"""
+    if len(segments) != 2:
+        return None
+    return _query_param(query, 'v')
+
+
+def _from_embed_like(segments: list[str], query: str) -> str | None:
+    """youtube.com/embed/VIDEO_ID and youtube.com/v/VIDEO_ID"""
+    return segments[2] if len(segments) >= 3 else None
+
+
+# Dispatch on (host, first path segment). Hosts whose path carries the video
+# ID directly register under an empty segment. Handlers receive the path
+# split once as path.split('/', 3), so segments[0] is always ''.
+_HANDLERS: dict[tuple[str, str], Callable[[list[str], str], str | None]] = {
+    ('youtu.be', ''): _from_short,
+    ('youtube.com', 'watch'): _from_watch,
+    ('www.youtube.com', 'watch'): _from_watch,
+    ('youtube.com', 'embed'): _from_embed_like,
+    ('www.youtube.com', 'embed'): _from_embed_like,
+    ('youtube.com', 'v'): _from_embed_like,
+    ('www.youtube.com', 'v'): _from_embed_like,
+}
+_YOUTUBE_HOSTS = frozenset(host for host, _ in _HANDLERS)
+
+
+@functools.lru_cache(maxsize=1024)
 def parse_youtube_url(url: str) -> str:
     """Extract video ID from YouTube URL.
 
+    Results are memoized per URL, since the pipeline parses the same URL
+    at several stages. Invalid URLs are not cached and raise on every call.
+
     Args:
         url: A YouTube video URL in any supported format.
 
@@ -21,47 +131,35 @@ def parse_youtube_url(url: str) -> str:
     if not url:
         raise URLParseError("URL is empty")
 
-    try:
-        parsed = urlparse(url)
-    except ValueError:
-        raise URLParseError("Invalid URL format")
+    # Cheap rejection of obviously foreign URLs before the full parse
+    head = url[:_HOST_PROBE_LENGTH].lower()
+    if not any(marker in head for marker in _HOST_MARKERS):
+        raise URLParseError("not a YouTube URL")
+
+    parts = _scan_youtube(url)
+    if parts is None:
+        try:
+            parsed = urlparse(url)
+        except ValueError:
+            raise URLParseError("Invalid URL format")
+        parts = parsed.netloc, parsed.path, parsed.query
 
-    netloc = parsed.netloc.lower()
-    if netloc not in ['youtube.com', 'www.youtube.com', 'youtu.be']:
+    host, path, query = parts
+    netloc = host.lower()
+    if netloc not in _YOUTUBE_HOSTS:
         raise URLParseError("not a YouTube URL")
 
-    path = parsed.path
-    query = parsed.query
-
-    video_id = None
-
-    if netloc == 'youtu.be':
-        # youtu.be/VIDEO_ID
-        if path.startswith('/'):
-            parts = path.split('/')
-            if len(parts) >= 2:
-                video_id = parts[1]
-    elif netloc in ['youtube.com', 'www.youtube.com']:
-        if path == '/watch':
-            # youtube.com/watch?v=VIDEO_ID
-            params = parse_qs(query)
-            video_id = params.get('v', [None])[0]
-        elif path.startswith('/embed/'):
-            # youtube.com/embed/VIDEO_ID
-            parts = path.split('/')
-            if len(parts) >= 3:
-                video_id = parts[2]
-        elif path.startswith('/v/'):
-            # youtube.com/v/VIDEO_ID
-            parts = path.split('/')
-            if len(parts) >= 3:
-                video_id = parts[2]
+    segments = path.split('/', 3)
+    first = segments[1] if len(segments) >= 2 else ''
+
+    handler = _HANDLERS.get((netloc, first)) or _HANDLERS.get((netloc, ''))
+    video_id = handler(segments, query) if handler else None
 
     if not video_id:
         raise URLParseError("video ID")
 
     # Validate video ID
-    if not re.match(r'^[a-zA-Z0-9_-]{11}$', video_id):
+    if len(video_id) != _VIDEO_ID_LENGTH or not _VIDEO_ID_ALPHABET.issuperset(video_id):
         raise URLParseError("11 characters")
 
     return video_id
\ No newline at end of file
@@ -0,0 +1,133 @@
+"""Tests for compliance validation."""
+
+import os
+import subprocess
+import sys
+
+import numpy as np
+
+from subsync._valid_aot import validate_timings
+from subsync.compliance import build_compliance_report
+from subsync.models import ProcessingConfig, Subtitle
+
+
+def _subtitle(index: int, start_ms: int, end_ms: int, *lines: str) -> Subtitle:
+    return Subtitle(
+        index=index,
+        start_time=start_ms,
+        end_time=end_ms,
+        text=" ".join(lines),
+        lines=list(lines),
+    )
+
+
+class TestBuildComplianceReport:
+    """Tests for build_compliance_report."""
+
+    def test_compliant_subtitles(self) -> None:
+        """Test subtitles within all limits produce a compliant report."""
+        subtitles = [
+            _subtitle(1, 0, 2000, "Hello world"),
+            _subtitle(2, 2100, 4000, "How are you?"),
+        ]
+        report = build_compliance_report(subtitles, ProcessingConfig())
+        assert report.total_subtitles == 2
+        assert report.timing_issues == 0
+        assert report.cps_warnings == 0
+        assert report.line_length_issues == 0
+        assert report.is_compliant is True
+        assert report.errors == ()
+
+    def test_empty_subtitles(self) -> None:
+        """Test an empty subtitle list is compliant."""
+        report = build_compliance_report([], ProcessingConfig())
+        assert report.total_subtitles == 0
+        assert report.is_compliant is True
+
+    def test_duration_and_gap_issues(self) -> None:
+        """Test short, long and too-close subtitles are counted as timing issues."""
+        subtitles = [
+            _subtitle(1, 0, 500, "Hi"),  # too short
+            _subtitle(2, 1000, 9000, "A long one"),  # too long
+            _subtitle(3, 9050, 11000, "Too close"),  # gap 50ms < 83ms
+        ]
+        report = build_compliance_report(subtitles, ProcessingConfig())
+        assert report.timing_issues == 3
+        assert report.is_compliant is False
+        assert len(report.errors) == 1
+
+    def test_timestamps_beyond_float32_precision(self) -> None:
+        """Test limits are exact for timestamps above 2**24 ms (~4h40m)."""
+        base = 2**24 + 3_000_001  # odd, so not representable as float32
+        subtitles = [
+            _subtitle(1, base, base + 833, "Exactly minimum"),
+            _subtitle(2, base + 916, base + 7916, "Exactly maximum"),
+            _subtitle(3, base + 7999, base + 8831, "One ms short"),
+        ]
+        report = build_compliance_report(subtitles, ProcessingConfig())
+        assert [s.duration_ms for s in subtitles] == [833, 7000, 832]
+        assert report.timing_issues == 1
+
+    def test_cps_warning_is_not_blocking(self) -> None:
+        """Test CPS violations are warnings and do not break compliance."""
+        subtitles = [_subtitle(1, 0, 1000, "x" * 30)]  # 30 CPS
+        report = build_compliance_report(subtitles, ProcessingConfig())
+        assert report.cps_warnings == 1
+        assert report.is_compliant is True
+        assert len(report.warnings) == 1
+
+    def test_cps_limit_matches_subtitle_cps(self) -> None:
+        """Test a limit not exactly representable in float32 matches Subtitle.cps."""
+        subtitles = [_subtitle(1, 0, 10000, "x" * 173)]  # exactly 17.3 CPS
+        report = build_compliance_report(subtitles, ProcessingConfig(max_cps_adult=17.3))
+        assert subtitles[0].cps == 17.3
+        assert report.cps_warnings == 0
+
+    def test_children_cps_limit(self) -> None:
+        """Test the stricter children's CPS limit is applied when configured."""
+        subtitles = [_subtitle(1, 0, 1000, "x" * 18)]  # 18 CPS
+        adult = build_compliance_report(subtitles, ProcessingConfig())
+        children = build_compliance_report(
+            subtitles, ProcessingConfig(is_children_content=True)
+        )
+        assert adult.cps_warnings == 0
+        assert children.cps_warnings == 1
+
+    def test_line_length_issues(self) -> None:
+        """Test lines over the character limit are counted."""
+        subtitles = [_subtitle(1, 0, 5000, "x" * 43, "short")]
+        report = build_compliance_report(subtitles, ProcessingConfig())
+        assert report.line_length_issues == 1
+        assert report.is_compliant is False
+
+
+class TestValidateTimingsKernel:
+    """Tests for the uncompiled validation kernel shared by AOT and JIT builds."""
+
+    def test_counts_violations(self) -> None:
+        """Test the pure Python kernel counts timing and CPS violations."""
+        starts = np.array([0, 1000, 9050], dtype=np.int64)
+        ends = np.array([500, 9000, 10000], dtype=np.int64)
+        char_counts = np.array([2, 10, 30], dtype=np.int32)
+        assert validate_timings(starts, ends, char_counts, 833, 7000, 83, 20.0) == (3, 1)
+
+
+class TestKernelLoading:
+    """Tests for choosing between the AOT extension and the JIT fallback."""
+
+    def test_aot_module_skips_numba_import(self) -> None:
+        """Test numba is not imported when the AOT extension is available."""
+        code = (
+            "import sys, types\n"
+            "stub = types.ModuleType('subsync.subsync_valid')\n"
+            "stub.validate_timings = lambda *args: (0, 0)\n"
+            "sys.modules['subsync.subsync_valid'] = stub\n"
+            "import subsync.compliance\n"
+            "assert subsync.compliance._validate_timings is stub.validate_timings\n"
+            "assert 'numba' not in sys.modules\n"
+        )
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        result = subprocess.run(
+            [sys.executable, "-c", code], env=env, capture_output=True, text=True
+        )
+        assert result.returncode == 0, result.stderr
\ No newline at end of file
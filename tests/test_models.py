@@ -1,8 +1,13 @@
 """Tests for data models."""
 
+import sys
+from dataclasses import FrozenInstanceError
 from datetime import timedelta
 from pathlib import Path
 
+import numpy as np
+import pytest
+
 from subsync.models import (
     ComplianceReport,
     OutputConfig,
@@ -15,6 +20,7 @@ from subsync.models import (
     TranscriptionSegment,
     VideoMetadata,
     Word,
+    WordArray,
 )
 
 
@@ -36,6 +42,18 @@ class TestVideoMetadata:
         assert meta.uploader == "Test Channel"
         assert meta.upload_date == "20240115"
 
+    def test_string_fields_are_interned(self) -> None:
+        """Test low-cardinality string fields are interned."""
+        uploader = "".join(["Test ", "Channel"])
+        meta = VideoMetadata(
+            id="dQw4w9WgXcQ",
+            title="Test Video",
+            duration=180.0,
+            uploader=uploader,
+            upload_date="20240115",
+        )
+        assert meta.uploader is sys.intern("Test Channel")
+
 
 class TestWord:
     """Tests for Word model."""
@@ -47,6 +65,13 @@ class TestWord:
         assert word.start == 0.0
         assert word.end == 0.5
 
+    def test_word_is_immutable(self) -> None:
+        """Test Word fields cannot be reassigned and no __dict__ is allocated."""
+        word = Word(word="hello", start=0.0, end=0.5)
+        with pytest.raises(FrozenInstanceError):
+            word.word = "bye"  # type: ignore[misc]
+        assert not hasattr(word, "__dict__")
+
 
 class TestTranscriptionSegment:
     """Tests for TranscriptionSegment model."""
@@ -80,6 +105,45 @@ class TestTranscriptionSegment:
         assert segment.words[0].word == "Hello"
 
 
+class TestWordArray:
+    """Tests for WordArray structure-of-arrays model."""
+
+    def test_from_segments(self) -> None:
+        """Test words are flattened across segments into parallel arrays."""
+        segments = [
+            TranscriptionSegment(
+                id=0,
+                start=0.0,
+                end=1.0,
+                text="Hello world",
+                words=[
+                    Word(word="Hello", start=0.0, end=0.25),
+                    Word(word="world", start=0.5, end=1.0),
+                ],
+            ),
+            TranscriptionSegment(
+                id=1,
+                start=1.5,
+                end=2.0,
+                text="again",
+                words=[Word(word="again", start=1.5, end=2.0)],
+            ),
+        ]
+        array = WordArray.from_segments(segments)
+        assert len(array) == 3
+        assert array.words == ["Hello", "world", "again"]
+        assert array.starts.dtype == np.float32
+        np.testing.assert_allclose(array.durations(), [0.25, 0.5, 0.5])
+        np.testing.assert_allclose(array.gaps(), [0.25, 0.5])
+
+    def test_from_segments_without_words(self) -> None:
+        """Test segments without word timestamps yield an empty array."""
+        segment = TranscriptionSegment(id=0, start=0.0, end=5.0, text="Hello")
+        array = WordArray.from_segments([segment])
+        assert len(array) == 0
+        assert array.gaps().size == 0
+
+
 class TestTranscriptionResult:
     """Tests for TranscriptionResult model."""
 
@@ -100,6 +164,12 @@ class TestTranscriptionResult:
         assert result.duration == 120.0
         assert len(result.segments) == 1
 
+    def test_language_is_interned(self) -> None:
+        """Test the language code is interned."""
+        language = "".join(["e", "n"])
+        result = TranscriptionResult(language=language, duration=1.0, segments=[])
+        assert result.language is sys.intern("en")
+
 
 class TestSubtitle:
     """Tests for Subtitle model and computed properties."""
@@ -108,8 +178,8 @@ class TestSubtitle:
         """Test character count with single line."""
         subtitle = Subtitle(
             index=1,
-            start_time=timedelta(seconds=0),
-            end_time=timedelta(seconds=2),
+            start_time=0,
+            end_time=2000,
             text="Hello world",
             lines=["Hello world"],
         )
@@ -119,30 +189,53 @@ class TestSubtitle:
         """Test character count with multiple lines."""
         subtitle = Subtitle(
             index=1,
-            start_time=timedelta(seconds=0),
-            end_time=timedelta(seconds=2),
+            start_time=0,
+            end_time=2000,
             text="Hello world, how are you?",
             lines=["Hello world,", "how are you?"],
         )
         assert subtitle.char_count == 24  # 12 + 12
 
+    def test_cps_empty_text_zero_duration(self) -> None:
+        """Test CPS is zero for empty text even with zero duration."""
+        subtitle = Subtitle(
+            index=1,
+            start_time=1000,
+            end_time=1000,
+            text="",
+            lines=[],
+        )
+        assert subtitle.cps == 0
+
     def test_duration_ms(self) -> None:
         """Test duration calculation in milliseconds."""
         subtitle = Subtitle(
             index=1,
-            start_time=timedelta(seconds=1),
-            end_time=timedelta(seconds=3, milliseconds=500),
+            start_time=1000,
+            end_time=3500,
             text="Test",
             lines=["Test"],
         )
         assert subtitle.duration_ms == 2500
 
+    def test_timedelta_helpers(self) -> None:
+        """Test millisecond timestamps convert to timedelta for writers."""
+        subtitle = Subtitle(
+            index=1,
+            start_time=1000,
+            end_time=3500,
+            text="Test",
+            lines=["Test"],
+        )
+        assert subtitle.start_timedelta == timedelta(seconds=1)
+        assert subtitle.end_timedelta == timedelta(seconds=3, milliseconds=500)
+
     def test_cps_calculation(self) -> None:
         """Test characters per second calculation."""
         subtitle = Subtitle(
             index=1,
-            start_time=timedelta(seconds=0),
-            end_time=timedelta(seconds=2),
+            start_time=0,
+            end_time=2000,
             text="Hello world",
             lines=["Hello world"],  # 11 chars
         )
@@ -153,12 +246,12 @@ class TestSubtitle:
         """Test CPS with zero duration (avoid division by zero)."""
         subtitle = Subtitle(
             index=1,
-            start_time=timedelta(seconds=1),
-            end_time=timedelta(seconds=1),  # Same time = 0 duration
+            start_time=1000,
+            end_time=1000,  # Same time = 0 duration
             text="Test",
             lines=["Test"],
         )
-        assert subtitle.cps == 0  # Avoid division by zero
+        assert subtitle.cps == 4000  # Duration clamped to 1ms
 
 
 class TestSubtitleFile:
@@ -168,8 +261,8 @@ class TestSubtitleFile:
         """Test SubtitleFile creation."""
         subtitle = Subtitle(
             index=1,
-            start_time=timedelta(seconds=0),
-            end_time=timedelta(seconds=2),
+            start_time=0,
+            end_time=2000,
             text="Hello",
             lines=["Hello"],
         )
@@ -196,7 +289,7 @@ class TestTimingValidation:
             gap_ok=True,
         )
         assert validation.is_valid is True
-        assert validation.issues == []
+        assert validation.issues == ()
 
     def test_invalid_timing_with_issues(self) -> None:
         """Test invalid timing with issues."""
@@ -204,7 +297,7 @@ class TestTimingValidation:
             is_valid=False,
             duration_ok=False,
             gap_ok=True,
-            issues=["Duration too short: 500ms < 833ms"],
+            issues=("Duration too short: 500ms < 833ms",),
         )
         assert validation.is_valid is False
         assert len(validation.issues) == 1
@@ -223,8 +316,8 @@ class TestComplianceReport:
             is_compliant=True,
         )
         assert report.is_compliant is True
-        assert report.warnings == []
-        assert report.errors == []
+        assert report.warnings == ()
+        assert report.errors == ()
 
     def test_non_compliant_report(self) -> None:
         """Test non-compliant report with issues."""
@@ -234,8 +327,8 @@ class TestComplianceReport:
             cps_warnings=1,
             line_length_issues=0,
             is_compliant=False,
-            warnings=["CPS exceeds limit for subtitle 5"],
-            errors=["Subtitle 3 duration too short", "Subtitle 7 duration too short"],
+            warnings=("CPS exceeds limit for subtitle 5",),
+            errors=("Subtitle 3 duration too short", "Subtitle 7 duration too short"),
         )
         assert report.is_compliant is False
         assert len(report.warnings) == 1
@@ -1,7 +1,9 @@
 """Tests for URL handler."""
 
+from urllib.parse import urlparse
+
 import pytest
-from subsync.url_handler import parse_youtube_url
+from subsync.url_handler import _scan_youtube, parse_youtube_url
 from subsync.errors import URLParseError
 
 
@@ -15,6 +17,11 @@ def test_short_url():
     assert parse_youtube_url(url) == "dQw4w9WgXcQ"
 
 
+def test_short_url_with_timestamp():
+    url = "https://youtu.be/dQw4w9WgXcQ?t=42"
+    assert parse_youtube_url(url) == "dQw4w9WgXcQ"
+
+
 def test_embed_url():
     url = "https://www.youtube.com/embed/dQw4w9WgXcQ"
     assert parse_youtube_url(url) == "dQw4w9WgXcQ"
@@ -35,6 +42,11 @@ def test_http_not_https():
     assert parse_youtube_url(url) == "dQw4w9WgXcQ"
 
 
+def test_uppercase_host():
+    url = "https://WWW.YouTube.com/watch?v=dQw4w9WgXcQ"
+    assert parse_youtube_url(url) == "dQw4w9WgXcQ"
+
+
 def test_with_timestamp():
     url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=42"
     assert parse_youtube_url(url) == "dQw4w9WgXcQ"
@@ -45,6 +57,16 @@ def test_with_playlist():
     assert parse_youtube_url(url) == "dQw4w9WgXcQ"
 
 
+def test_video_param_not_first():
+    url = "https://www.youtube.com/watch?feature=share&v=dQw4w9WgXcQ"
+    assert parse_youtube_url(url) == "dQw4w9WgXcQ"
+
+
+def test_percent_encoded_param_name():
+    url = "https://www.youtube.com/watch?%76=dQw4w9WgXcQ"
+    assert parse_youtube_url(url) == "dQw4w9WgXcQ"
+
+
 def test_id_with_underscore():
     url = "https://www.youtube.com/watch?v=abc_def_123"
     assert parse_youtube_url(url) == "abc_def_123"
@@ -61,6 +83,12 @@ def test_non_youtube_url():
         parse_youtube_url(url)
 
 
+def test_youtube_lookalike_host():
+    url = "https://youtube.com.example.org/watch?v=dQw4w9WgXcQ"
+    with pytest.raises(URLParseError, match="not a YouTube URL"):
+        parse_youtube_url(url)
+
+
 def test_missing_video_id():
     url = "https://www.youtube.com/watch"
     with pytest.raises(URLParseError, match="video ID"):
@@ -97,7 +125,70 @@ def test_channel_url():
         parse_youtube_url(url)
 
 
+def test_embed_without_video_id():
+    url = "https://youtube.com/embed"
+    with pytest.raises(URLParseError, match="video ID"):
+        parse_youtube_url(url)
+
+
 def test_playlist_only_url():
     url = "https://www.youtube.com/playlist?list=PLxyz"
     with pytest.raises(URLParseError):
-        parse_youtube_url(url)
\ No newline at end of file
+        parse_youtube_url(url)
+
+
+def test_repeated_url_is_cached():
+    url = "https://www.youtube.com/watch?v=cAcHeDiD_01"
+    parse_youtube_url(url)
+    hits = parse_youtube_url.cache_info().hits
+    assert parse_youtube_url(url) == "cAcHeDiD_01"
+    assert parse_youtube_url.cache_info().hits == hits + 1
+
+
+def test_repeated_invalid_url_still_raises():
+    url = "https://www.youtube.com/watch?v=short"
+    for _ in range(2):
+        with pytest.raises(URLParseError, match="11 characters"):
+            parse_youtube_url(url)
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=42",
+        "http://youtu.be/dQw4w9WgXcQ",
+        "https://youtu.be?v=x",
+        "https://www.youtube.com/embed/dQw4w9WgXcQ#frag?x=1",
+        "https://www.youtube.com",
+    ],
+)
+def test_scanner_matches_urlparse(url):
+    parsed = urlparse(url)
+    assert _scan_youtube(url) == (parsed.netloc, parsed.path, parsed.query)
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "ftp://youtube.com/watch?v=dQw4w9WgXcQ",
+        "https://user@youtube.com/watch?v=dQw4w9WgXcQ",
+        "https://youtube.com:443/watch?v=dQw4w9WgXcQ",
+        "https://youtube.com/watch?v=dQw4w9WgXcQ\n",
+        "youtube.com/watch?v=dQw4w9WgXcQ",
+        "https://www.youtube.com/watch;x?v=dQw4w9WgXcQ",
+        "https://youtube.com/embed/dQw4w9WgXcQ;x",
+    ],
+)
+def test_scanner_defers_unusual_urls(url):
+    assert _scan_youtube(url) is None
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://www.youtube.com/watch;x?v=dQw4w9WgXcQ",
+        "https://youtube.com/embed/dQw4w9WgXcQ;x",
+    ],
+)
+def test_path_params_are_ignored(url):
+    assert parse_youtube_url(url) == "dQw4w9WgXcQ"
\ No newline at end of file